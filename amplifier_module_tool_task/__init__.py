@@ -19,8 +19,11 @@ Config Options:
 - exclude_hooks: List of hooks spawned agents should NOT receive (e.g., ["hooks-logging"])
 - inherit_hooks: List of hooks spawned agents SHOULD receive (mutually exclusive with exclude_hooks)
 - max_recursion_depth: Maximum depth for nested delegations (default: 1)
+- max_concurrent_delegates: Maximum sub-sessions running at once in a batch (default: 4)
+- max_batch_size: Maximum number of instructions accepted in one batch (default: 10)
 
 Tool Parameters (caller-controlled):
+- instructions: Batch mode - list of instructions, each delegated to the agent concurrently
 - inherit_context: Context inheritance mode - "none" (default), "recent", or "all"
 - inherit_context_turns: Number of recent turns when inherit_context is "recent" (default: 5)
 """
@@ -28,9 +31,17 @@ Tool Parameters (caller-controlled):
 # Amplifier module metadata
 __amplifier_module_type__ = "tool"
 
+import asyncio
+import io
 import logging
-import uuid
+import re
+import secrets
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterator
 from typing import Any
+from typing import ClassVar
+from typing import NamedTuple
 
 from amplifier_core import ModuleCoordinator
 from amplifier_core import ToolResult
@@ -38,6 +49,113 @@ from amplifier_foundation import ProviderPreference
 
 logger = logging.getLogger(__name__)
 
+# Content block types to explicitly filter out (tool-related and internal)
+_FILTERED_BLOCK_TYPES = frozenset(
+    {
+        "tool_use",  # Anthropic tool call format
+        "tool_call",  # Amplifier internal tool call format
+        "tool_result",  # Tool results
+        "thinking",  # Internal reasoning blocks
+        "redacted_thinking",  # Redacted thinking blocks
+    }
+)
+
+# Child span segment appended to the parent ID for each nested sub-session
+# (see TaskTool.execute); counting them gives a session's delegation depth
+_CHILD_SPAN_RE = re.compile(r"-[0-9a-f]{16}_")
+
+# Inherited messages longer than this are truncated in the parent context text
+_MAX_CONTEXT_CONTENT_LEN = 2000
+
+# Static portion of the tool description; the agent list is appended per registry.
+_DESCRIPTION_PREFIX = """
+Launch a new agent to handle complex, multi-step tasks autonomously.
+
+The task tool launches specialized agents (subprocesses) that autonomously handle complex tasks. Each agent type has
+specific capabilities and tools available to it.
+
+When using the task tool, you must specify an agent parameter to select which agent type to use.
+
+When NOT to use the task tool:
+- If you want to read a specific file path, use the read_file or glob tool instead of the task tool, to find the match more quickly
+- If you are searching for a specific class definition like "class Foo", use the glob tool instead, to find the match more quickly
+- If you are searching for code within a specific file or set of 2-3 files, use the read_file tool instead of the task tool, to
+find the match more quickly
+- Other tasks that are not related to the agent descriptions above
+
+Usage notes:
+- Launch multiple agents concurrently whenever possible, to maximize performance; to do that, use a single message with multiple tool uses
+- When the agent is done, it will return a single message back to you. The result returned by the agent is not visible to the user. To show the user the result, you should send a text message back to the user with a concise summary of the result.
+- Each agent invocation is stateless. You will not be able to send additional messages to the agent, nor will the agent be able to communicate with you outside of its final report. Therefore, your prompt should contain a highly detailed task description for the agent to perform autonomously and you should specify exactly what information the agent should return back to you in its final and only message to you.
+- The agent's outputs should generally be trusted
+- Clearly tell the agent whether you expect it to write code or just to do research (search, file reads, web fetches, etc.), since it is not aware of the user's intent
+- If the agent description mentions that it should be used proactively, then you should try your best to use it without the user having to ask for it first. Use your judgement.
+- If the user specifies that they want you to run agents "in parallel", you MUST send a single message with multiple Task tool use content blocks. For example, if you need to launch both a code-reviewer agent and a test-runner agent in parallel, send a single message with both tool calls.
+- While each agent invocation is stateless, if you DO need to re-engage with an existing agent session, use the session_id returned from the initial agent response to resume the session instead of creating a new one.
+
+Example usage:
+
+<example_agent_descriptions>
+"code-reviewer": use this agent after you are done writing a significant piece of code
+"greeting-responder": use this agent when to respond to user greetings with a friendly joke
+</example_agent_description>
+
+<example>
+user: "Please write a function that checks if a number is prime"
+assistant: Sure let me write a function that checks if a number is prime
+assistant: First let me use the write_file tool to write a function that checks if a number is prime
+assistant: I'm going to use the write_file tool to write the following code:
+<code>
+function isPrime(n) {
+  if (n <= 1) return false
+  for (let i = 2; i * i <= n; i++) {
+    if (n % i === 0) return false
+  }
+  return true
+}
+</code>
+<commentary>
+Since a significant piece of code was written and the task was completed, now use the code-reviewer agent to review the code
+</commentary>
+assistant: Now let me use the code-reviewer agent to review the code
+assistant: Uses the task tool to launch the code-reviewer agent
+</example>
+
+<example>
+user: "Hello"
+<commentary>
+Since the user is greeting, use the greeting-responder agent to respond with a friendly joke
+</commentary>
+assistant: "I'm going to use the task tool to launch the greeting-responder agent"
+</example>
+Available agent types and the tools they have access to:
+"""
+
+
+class AgentInfo(NamedTuple):
+    """Registered agent as listed in the tool description."""
+
+    name: str
+    description: str
+
+
+# Background hook emissions, referenced until done so they are not collected
+_background_emits: set[asyncio.Task] = set()
+
+
+def _background_emit_done(task: asyncio.Task) -> None:
+    """Release a finished background emit and log any failure."""
+    _background_emits.discard(task)
+    if not task.cancelled() and (exc := task.exception()) is not None:
+        logger.warning(f"Background hook emission failed: {exc}")
+
+
+def _truncate(content: str, max_len: int = _MAX_CONTEXT_CONTENT_LEN) -> str:
+    """Truncate content longer than max_len, marking where it was cut."""
+    if len(content) > max_len:
+        return content[:max_len] + "... [truncated]"
+    return content
+
 
 async def mount(coordinator: ModuleCoordinator, config: dict[str, Any] | None = None):
     """Mount the task delegation tool.
@@ -50,6 +168,8 @@ async def mount(coordinator: ModuleCoordinator, config: dict[str, Any] | None =
             - exclude_hooks: Hooks spawned agents should NOT inherit (e.g., ["hooks-logging"])
             - inherit_hooks: Hooks spawned agents SHOULD inherit (mutually exclusive with exclude_hooks)
             - max_recursion_depth: Maximum depth for nested delegations (default: 1)
+            - max_concurrent_delegates: Max concurrent sub-sessions in a batch (default: 4)
+            - max_batch_size: Max instructions accepted in one batch (default: 10)
 
     Returns:
         None - No cleanup needed for this module
@@ -91,6 +211,16 @@ class TaskTool:
 
     name = "task"
 
+    # Static validation error payloads. ToolResult copies the error dict on
+    # construction, so these are shared safely; results themselves are
+    # mutable models and are built per call.
+    _ERR_EMPTY_INSTRUCTION: ClassVar[dict[str, str]] = {
+        "message": "Instruction cannot be empty"
+    }
+    _ERR_AGENT_REQUIRED: ClassVar[dict[str, str]] = {
+        "message": "Agent name required for new delegation (or provide session_id to resume)"
+    }
+
     def __init__(self, coordinator: ModuleCoordinator, config: dict[str, Any]):
         """Initialize the task tool.
 
@@ -102,6 +232,8 @@ class TaskTool:
                 - exclude_hooks: Hooks spawned agents should NOT inherit
                 - inherit_hooks: Hooks spawned agents SHOULD inherit
                 - max_recursion_depth: Max delegation depth (default: 1)
+                - max_concurrent_delegates: Max concurrent batch sub-sessions (default: 4)
+                - max_batch_size: Max instructions per batch (default: 10)
         """
         self.coordinator = coordinator
         self.config = config
@@ -118,90 +250,66 @@ class TaskTool:
             "inherit_hooks"
         )  # None means inherit all
 
-    @property
-    def description(self) -> str:
-        """Generate dynamic description with available agents.
-
-        Queries the agent registry to provide an up-to-date list
-        of available agents in the tool description.
-        """
-        agents_list = self._get_agent_list()
-        if agents_list:
-            agent_desc = "\n".join(
-                f"  - {a['name']}: {a.get('description', 'No description')}"
-                for a in agents_list
-            )
-            return (
-                """
-Launch a new agent to handle complex, multi-step tasks autonomously.
+        # Maximum depth for nested delegations
+        self.max_recursion_depth: int = config.get("max_recursion_depth", 1)
 
-The task tool launches specialized agents (subprocesses) that autonomously handle complex tasks. Each agent type has
-specific capabilities and tools available to it.
+        # Maximum sub-sessions running at once for a batch delegation
+        self.max_concurrent_delegates: int = config.get("max_concurrent_delegates", 4)
 
-When using the task tool, you must specify an agent parameter to select which agent type to use.
+        # Maximum instructions (and so sub-sessions) accepted in one batch
+        self.max_batch_size: int = config.get("max_batch_size", 10)
 
-When NOT to use the task tool:
-- If you want to read a specific file path, use the read_file or glob tool instead of the task tool, to find the match more quickly
-- If you are searching for a specific class definition like "class Foo", use the glob tool instead, to find the match more quickly
-- If you are searching for code within a specific file or set of 2-3 files, use the read_file tool instead of the task tool, to
-find the match more quickly
-- Other tasks that are not related to the agent descriptions above
+        # Build tool inheritance policy from config (fixed for the tool's lifetime)
+        self._tool_inheritance: dict[str, list[str]] = {}
+        if self.exclude_tools:
+            self._tool_inheritance["exclude_tools"] = self.exclude_tools
+        elif self.inherit_tools is not None:
+            self._tool_inheritance["inherit_tools"] = self.inherit_tools
 
-Usage notes:
-- Launch multiple agents concurrently whenever possible, to maximize performance; to do that, use a single message with multiple tool uses
-- When the agent is done, it will return a single message back to you. The result returned by the agent is not visible to the user. To show the user the result, you should send a text message back to the user with a concise summary of the result.
-- Each agent invocation is stateless. You will not be able to send additional messages to the agent, nor will the agent be able to communicate with you outside of its final report. Therefore, your prompt should contain a highly detailed task description for the agent to perform autonomously and you should specify exactly what information the agent should return back to you in its final and only message to you.
-- The agent's outputs should generally be trusted
-- Clearly tell the agent whether you expect it to write code or just to do research (search, file reads, web fetches, etc.), since it is not aware of the user's intent
-- If the agent description mentions that it should be used proactively, then you should try your best to use it without the user having to ask for it first. Use your judgement.
-- If the user specifies that they want you to run agents "in parallel", you MUST send a single message with multiple Task tool use content blocks. For example, if you need to launch both a code-reviewer agent and a test-runner agent in parallel, send a single message with both tool calls.
-- While each agent invocation is stateless, if you DO need to re-engage with an existing agent session, use the session_id returned from the initial agent response to resume the session instead of creating a new one.
+        # Build hook inheritance policy from config
+        self._hook_inheritance: dict[str, list[str]] = {}
+        if self.exclude_hooks:
+            self._hook_inheritance["exclude_hooks"] = self.exclude_hooks
+        elif self.inherit_hooks is not None:
+            self._hook_inheritance["inherit_hooks"] = self.inherit_hooks
 
-Example usage:
+        # Agents registry caches (see _sync_agents_cache): the registry dict and
+        # its names they were built from, the sorted agent list, and the
+        # rendered description
+        self._agents_cache_key: tuple[dict[str, Any], tuple[str, ...]] | None = None
+        self._agents_list_cache: tuple[AgentInfo, ...] | None = None
+        self._description_cache: str | None = None
 
-<example_agent_descriptions>
-"code-reviewer": use this agent after you are done writing a significant piece of code
-"greeting-responder": use this agent when to respond to user greetings with a friendly joke
-</example_agent_description>
+    @property
+    def description(self) -> str:
+        """Generate dynamic description with available agents.
 
-<example>
-user: "Please write a function that checks if a number is prime"
-assistant: Sure let me write a function that checks if a number is prime
-assistant: First let me use the write_file tool to write a function that checks if a number is prime
-assistant: I'm going to use the write_file tool to write the following code:
-<code>
-function isPrime(n) {
-  if (n <= 1) return false
-  for (let i = 2; i * i <= n; i++) {
-    if (n % i === 0) return false
-  }
-  return true
-}
-</code>
-<commentary>
-Since a significant piece of code was written and the task was completed, now use the code-reviewer agent to review the code
-</commentary>
-assistant: Now let me use the code-reviewer agent to review the code
-assistant: Uses the task tool to launch the code-reviewer agent
-</example>
+        Queries the agent registry to provide an up-to-date list
+        of available agents in the tool description. The rendered text is
+        cached until the agents registry is replaced or its names change.
+        """
+        self._sync_agents_cache()
+        if self._description_cache is not None:
+            return self._description_cache
 
-<example>
-user: "Hello"
-<commentary>
-Since the user is greeting, use the greeting-responder agent to respond with a friendly joke
-</commentary>
-assistant: "I'm going to use the task tool to launch the greeting-responder agent"
-</example>
-                    """
-                f"Available agent types and the tools they have access to:\n{agent_desc}"
+        agents = self._get_agent_list()
+        if agents:
+            agent_desc = "\n".join(
+                f"  - {agent.name}: {agent.description}" for agent in agents
             )
-        return "The task tool is currently unavailable because there are no registered agents."
+            description = _DESCRIPTION_PREFIX + agent_desc
+        else:
+            description = "The task tool is currently unavailable because there are no registered agents."
+
+        self._description_cache = description
+        return description
 
     @property
     def input_schema(self) -> dict:
         """Input schema for task delegation.
 
-        Supports both spawn (agent + instruction) and resume (session_id + instruction).
+        Supports spawn (agent + instruction), batch spawn (agent + instructions)
+        and resume (session_id + instruction).
 
         Returns:
             JSON schema for the tool input with structured parameters
@@ -217,6 +325,12 @@ assistant: "I'm going to use the task tool to launch the greeting-responder agen
                     "type": "string",
                     "description": "Task instruction for the agent",
                 },
+                "instructions": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "maxItems": self.max_batch_size,
+                    "description": f"Batch mode: instead of 'instruction', a list of at most {self.max_batch_size} task instructions for the agent. Each runs in its own sub-session, concurrently; results are returned together",
+                },
                 "session_id": {
                     "type": "string",
                     "description": "Optional Session ID to resume (from previous spawn/resume response)",
@@ -249,20 +363,23 @@ assistant: "I'm going to use the task tool to launch the greeting-responder agen
                     },
                 },
             },
-            "required": ["instruction"],
+            "required": [],
         }
 
-    async def _extract_parent_messages(
+    async def _select_parent_messages(
         self, inherit_context: str, inherit_context_turns: int
     ) -> list[dict[str, Any]] | None:
-        """Extract messages from parent session based on inheritance policy.
+        """Fetch the raw parent messages covered by the inheritance policy.
+
+        Messages are returned unsanitized; _build_parent_context_text
+        sanitizes and formats them.
 
         Args:
             inherit_context: Inheritance mode - "none", "recent", or "all"
             inherit_context_turns: Number of recent turns to include (for "recent" mode)
 
         Returns:
-            List of messages to pass to child session, or None if inherit_context is "none"
+            Selected raw messages, or None if there is nothing to inherit
         """
         if inherit_context == "none":
             return None
@@ -273,27 +390,46 @@ assistant: "I'm going to use the task tool to launch the greeting-responder agen
             logger.debug("No parent context available for inheritance")
             return None
 
-        try:
-            messages = await parent_context.get_messages()
-            if not messages:
-                return None
+        messages = await parent_context.get_messages()
+        if not messages:
+            return None
 
-            if inherit_context == "all":
-                # Return all messages, sanitized for child consumption
-                return self._sanitize_messages_for_child(messages)
+        if inherit_context == "all":
+            return messages
 
-            elif inherit_context == "recent":
-                # Extract last N turns (a turn is a user->assistant exchange)
-                recent_messages = self._extract_recent_turns(
-                    messages, inherit_context_turns
-                )
-                return self._sanitize_messages_for_child(recent_messages)
+        elif inherit_context == "recent":
+            # Extract last N turns (a turn is a user->assistant exchange)
+            return self._extract_recent_turns(messages, inherit_context_turns)
 
-            return None
+        return None
+
+    async def _extract_parent_context(
+        self, inherit_context: str, inherit_context_turns: int
+    ) -> str:
+        """Extract parent context as instruction text based on inheritance policy.
+
+        This ensures the child agent sees the parent context regardless of
+        how the session/orchestrator handles pre-existing context messages.
+
+        Args:
+            inherit_context: Inheritance mode - "none", "recent", or "all"
+            inherit_context_turns: Number of recent turns to include (for "recent" mode)
+
+        Returns:
+            Formatted parent context text, or "" if there is nothing to inherit
+        """
+        try:
+            messages = await self._select_parent_messages(
+                inherit_context, inherit_context_turns
+            )
+            if not messages:
+                return ""
+
+            return self._build_parent_context_text(messages)
 
         except Exception as e:
             logger.warning(f"Failed to extract parent messages: {e}")
-            return None
+            return ""
 
     def _extract_recent_turns(
         self, messages: list[dict[str, Any]], n_turns: int
@@ -313,23 +449,27 @@ assistant: "I'm going to use the task tool to launch the greeting-responder agen
         if not messages or n_turns <= 0:
             return []
 
-        # Find indices where user messages start (turn boundaries)
-        turn_starts = [i for i, m in enumerate(messages) if m.get("role") == "user"]
-
-        if not turn_starts:
-            return messages  # No user messages, return all
-
-        if len(turn_starts) <= n_turns:
-            return messages  # Fewer turns than requested, return all
+        # Walk backwards over turn boundaries (user messages), stopping as soon
+        # as we know whether an earlier turn exists beyond the last N
+        start_index = None
+        seen_turns = 0
+        for i in range(len(messages) - 1, -1, -1):
+            if messages[i].get("role") != "user":
+                continue
+            seen_turns += 1
+            if seen_turns == n_turns:
+                start_index = i
+            elif seen_turns > n_turns:
+                # Get messages from the nth-to-last turn onwards
+                return messages[start_index:]
 
-        # Get messages from the nth-to-last turn onwards
-        start_index = turn_starts[-n_turns]
-        return messages[start_index:]
+        # No user messages, or fewer turns than requested: return all
+        return messages
 
-    def _sanitize_messages_for_child(
-        self, messages: list[dict[str, Any]]
-    ) -> list[dict[str, Any]]:
-        """Sanitize messages for safe injection into child session.
+    def _iter_child_messages(
+        self, messages: list[dict[str, Any]], max_len: int | None = None
+    ) -> Iterator[tuple[str, str]]:
+        """Yield (role, content) for each parent message a child should see.
 
         Strips non-essential fields and ensures message format compatibility.
         Only includes user and assistant messages (skips system/tool messages
@@ -345,11 +485,11 @@ assistant: "I'm going to use the task tool to launch the greeting-responder agen
 
         Args:
             messages: Raw messages from parent
+            max_len: Optional length past which list content stops being collected
 
-        Returns:
-            Sanitized messages suitable for child context
+        Yields:
+            Role and sanitized text content of each retained message
         """
-        sanitized = []
         for msg in messages:
             role = msg.get("role")
 
@@ -374,17 +514,23 @@ assistant: "I'm going to use the task tool to launch the greeting-responder agen
                     continue
 
                 content = msg.get("content", "")
-                sanitized_content = self._sanitize_content(content)
+
+                # Plain string content (the common case) needs no block filtering
+                if isinstance(content, str):
+                    if content:
+                        yield role, content
+                    continue
+
+                sanitized_content = self._sanitize_content(content, max_len)
 
                 # Only include message if it has content after sanitization
+                # Do NOT carry tool_calls or any other fields
                 if sanitized_content:
-                    # Create a clean message with ONLY role and content
-                    # Do NOT copy tool_calls or any other fields
-                    sanitized_msg = {"role": role, "content": sanitized_content}
-                    sanitized.append(sanitized_msg)
-        return sanitized
+                    yield role, sanitized_content
 
-    def _sanitize_content(self, content: Any) -> str | list[dict[str, Any]]:
+    def _sanitize_content(
+        self, content: Any, max_len: int | None = None
+    ) -> str | list[dict[str, Any]]:
         """Sanitize message content, handling both string and list formats.
 
         Content formats that need to be handled:
@@ -401,6 +547,9 @@ assistant: "I'm going to use the task tool to launch the greeting-responder agen
 
         Args:
             content: Message content (string or list of content blocks)
+            max_len: Optional length limit for list content. Once the extracted
+                text is longer than this, remaining blocks are skipped; callers
+                that truncate anyway avoid joining text they would discard.
 
         Returns:
             Sanitized content as string (preferred) or list of text blocks
@@ -411,15 +560,8 @@ assistant: "I'm going to use the task tool to launch the greeting-responder agen
 
         # Handle list of content blocks
         if isinstance(content, list):
-            text_parts = []
-            # Types to explicitly filter out (tool-related and internal)
-            filtered_types = {
-                "tool_use",  # Anthropic tool call format
-                "tool_call",  # Amplifier internal tool call format
-                "tool_result",  # Tool results
-                "thinking",  # Internal reasoning blocks
-                "redacted_thinking",  # Redacted thinking blocks
-            }
+            # Each text part is written with a leading separator, dropped on return
+            buf = io.StringIO()
 
             for block in content:
                 if isinstance(block, dict):
@@ -428,8 +570,9 @@ assistant: "I'm going to use the task tool to launch the greeting-responder agen
                     if block_type == "text":
                         text = block.get("text", "")
                         if text:
-                            text_parts.append(text)
-                    elif block_type in filtered_types:
+                            buf.write("\n")
+                            buf.write(text)
+                    elif block_type in _FILTERED_BLOCK_TYPES:
                         # Explicitly skip these - they're tool or internal blocks
                         pass
                     else:
@@ -440,85 +583,103 @@ assistant: "I'm going to use the task tool to launch the greeting-responder agen
                         )
                 elif isinstance(block, str):
                     # Sometimes content blocks can be plain strings
-                    text_parts.append(block)
+                    buf.write("\n")
+                    buf.write(block)
+
+                # Stop once past the limit (the buffer holds one extra separator)
+                if max_len is not None and buf.tell() > max_len + 1:
+                    break
 
             # Return as single string if we have text
-            if text_parts:
-                return "\n".join(text_parts)
+            if buf.tell():
+                return buf.getvalue()[1:]
 
         # Empty or unrecognized format
         return ""
 
-    def _format_parent_context_for_instruction(
-        self, messages: list[dict[str, Any]]
-    ) -> str:
-        """Format parent messages as text to prepend to the instruction.
-
-        This ensures the child agent sees the parent context regardless of
-        how the session/orchestrator handles pre-existing context messages.
+    def _build_parent_context_text(self, messages: list[dict[str, Any]]) -> str:
+        """Sanitize raw parent messages and format them in a single pass.
 
         Args:
-            messages: List of sanitized messages from parent session
+            messages: Raw messages from parent session
 
         Returns:
-            Formatted text block with parent conversation context
+            Formatted text block with parent conversation context, or "" if
+            no messages survive sanitization
         """
-        if not messages:
+        # Role labels are the uppercased role (USER, ASSISTANT); very long
+        # messages are truncated to avoid overwhelming the child
+        body = "\n\n".join(
+            f"{role.upper()}: {_truncate(content)}"
+            for role, content in self._iter_child_messages(
+                messages, _MAX_CONTEXT_CONTENT_LEN
+            )
+        )
+        if not body:
             return ""
 
-        lines = ["[PARENT CONVERSATION CONTEXT]"]
-        lines.append(
-            "The following is recent conversation history from the parent session:"
+        return (
+            "[PARENT CONVERSATION CONTEXT]\n"
+            "The following is recent conversation history from the parent session:\n"
+            f"\n{body}\n\n[END PARENT CONTEXT]"
         )
-        lines.append("")
-
-        for msg in messages:
-            role = msg.get("role", "unknown")
-            content = msg.get("content", "")
-
-            # Format role nicely
-            role_label = role.upper()
-            if role == "user":
-                role_label = "USER"
-            elif role == "assistant":
-                role_label = "ASSISTANT"
 
-            # Truncate very long messages to avoid overwhelming the child
-            max_content_len = 2000
-            if len(content) > max_content_len:
-                content = content[:max_content_len] + "... [truncated]"
+    def _agents(self) -> dict[str, Any]:
+        """Get the agents registry from the mount plan.
 
-            lines.append(f"{role_label}: {content}")
-            lines.append("")
-
-        lines.append("[END PARENT CONTEXT]")
-        return "\n".join(lines)
+        Returns:
+            Agent configurations keyed by agent name
+        """
+        # Agents live in the coordinator's infrastructure config property
+        return self.coordinator.config.get("agents", {})
 
-    def _get_agent_list(self) -> list[dict[str, Any]]:
+    def _get_agent_list(self) -> tuple[AgentInfo, ...]:
         """Get list of available agents from mount plan.
 
         Reads agents section from the session's mount plan configuration.
+        The sorted list is cached until the agents registry is replaced or
+        its names change.
 
         Returns:
-            List of agent definitions with name and description
+            Agent names and descriptions, sorted by name
         """
-        # Get agents from coordinator's infrastructure config property
-        agents = self.coordinator.config.get("agents", {})
+        agents = self._sync_agents_cache()
+        if self._agents_list_cache is not None:
+            return self._agents_list_cache
 
-        sorted_agents = sorted(agents.items(), key=lambda item: item[0])
-        return [
-            {"name": name, "description": cfg.get("description", "No description")}
-            for name, cfg in sorted_agents
-        ]
+        self._agents_list_cache = tuple(
+            AgentInfo(name, agents[name].get("description", "No description"))
+            for name in sorted(agents)
+        )
+        return self._agents_list_cache
+
+    def _sync_agents_cache(self) -> dict[str, Any]:
+        """Get the agents registry, dropping derived caches if it changed.
+
+        The agent list and description caches stay valid while the registry
+        is the same dict object with the same agent names.
+
+        Returns:
+            Agent configurations keyed by agent name
+        """
+        agents = self._agents()
+        cache_key = self._agents_cache_key
+        names = tuple(agents)
+        if cache_key is None or cache_key[0] is not agents or cache_key[1] != names:
+            # Holding the dict keeps its identity unambiguous while cached
+            self._agents_cache_key = (agents, names)
+            self._agents_list_cache = None
+            self._description_cache = None
+        return agents
 
     async def execute(self, input: dict) -> ToolResult:
         """Execute delegation with structured parameters.
 
-        Routes to spawn (new sub-session) or resume (existing sub-session)
-        based on input parameters.
+        Routes to spawn (new sub-session), batch spawn (one sub-session per
+        instruction) or resume (existing sub-session) based on input parameters.
 
         Args:
-            input: Dict with 'instruction' (required) and either:
+            input: Dict with 'instruction' (or 'instructions' for a batch) and either:
                    - 'agent' (for spawn) or
                    - 'session_id' (for resume)
 
@@ -526,9 +687,11 @@ assistant: "I'm going to use the task tool to launch the greeting-responder agen
             ToolResult with success status and output or error
         """
         # Extract parameters
-        agent_name = input.get("agent", "").strip()
-        instruction = input.get("instruction", "").strip()
-        session_id = input.get("session_id", "").strip()
+        # (explicit nulls from the caller are treated as absent)
+        agent_name = (input.get("agent") or "").strip()
+        instruction = (input.get("instruction") or "").strip()
+        instructions = input.get("instructions")
+        session_id = (input.get("session_id") or "").strip()
 
         # Context inheritance parameters (caller-controlled)
         inherit_context = input.get("inherit_context", "none")
@@ -542,106 +705,250 @@ assistant: "I'm going to use the task tool to launch the greeting-responder agen
                 ProviderPreference.from_dict(p) for p in raw_provider_prefs
             ]
 
-        # Validate instruction (always required)
-        if not instruction:
-            return ToolResult(
-                success=False, error={"message": "Instruction cannot be empty"}
-            )
-
-        # Get hooks for error handling
-        hooks = self.coordinator.get("hooks")
+        # Validate instruction(s) (always required)
+        if instructions is not None:
+            if instruction:
+                return ToolResult(
+                    success=False,
+                    error={
+                        "message": "Provide either 'instruction' or 'instructions', not both"
+                    },
+                )
+            if session_id:
+                return ToolResult(
+                    success=False,
+                    error={
+                        "message": "Batch 'instructions' cannot be used with session_id (resume takes a single instruction)"
+                    },
+                )
+            if not isinstance(instructions, list) or not instructions:
+                return ToolResult(
+                    success=False,
+                    error={"message": "Instructions must be a non-empty list"},
+                )
+            if len(instructions) > self.max_batch_size:
+                return ToolResult(
+                    success=False,
+                    error={
+                        "message": f"Too many instructions ({len(instructions)}); a batch accepts at most {self.max_batch_size}"
+                    },
+                )
+            if not all(isinstance(i, str) and i.strip() for i in instructions):
+                return ToolResult(
+                    success=False,
+                    error={"message": "Instructions cannot contain empty entries"},
+                )
+            instructions = [i.strip() for i in instructions]
+        elif not instruction:
+            return ToolResult(success=False, error=self._ERR_EMPTY_INSTRUCTION)
 
         # Route based on session_id presence
         if session_id:
             # RESUME MODE: Continue existing sub-session
-            return await self._resume_existing_session(session_id, instruction, hooks)
+            return await self._resume_existing_session(
+                session_id, instruction, self.coordinator.get("hooks")
+            )
 
         # SPAWN MODE: Create new sub-session (requires agent)
         if not agent_name:
+            return ToolResult(success=False, error=self._ERR_AGENT_REQUIRED)
+
+        # Check agent exists in registry (same dict is passed on to the spawner)
+        agents = self._agents()
+        if agent_name not in agents:
+            return ToolResult(
+                success=False, error={"message": f"Agent '{agent_name}' not found"}
+            )
+
+        # Get parent session ID from coordinator infrastructure
+        parent_session_id = self.coordinator.session_id
+
+        # Enforce recursion depth before doing any context or spawn work
+        depth = len(_CHILD_SPAN_RE.findall(parent_session_id or ""))
+        if depth >= self.max_recursion_depth:
             return ToolResult(
                 success=False,
                 error={
-                    "message": "Agent name required for new delegation (or provide session_id to resume)"
+                    "message": f"Max recursion depth ({self.max_recursion_depth}) exceeded; cannot delegate to '{agent_name}' from this session"
                 },
             )
 
-        # Check agent exists in registry
-        agents = self.coordinator.config.get("agents", {})
-        if agent_name not in agents:
+        # Get spawn capability (registered by app layer) once, before any
+        # context or spawn work
+        spawn_fn = self.coordinator.get_capability("session.spawn")
+        if spawn_fn is None:
             return ToolResult(
-                success=False, error={"message": f"Agent '{agent_name}' not found"}
+                success=False,
+                error={
+                    "message": "Session spawning not available. App layer must register 'session.spawn' capability."
+                },
+            )
+
+        # Get hooks for event emission once the request is known to be valid
+        # (orchestrator will emit tool:pre/post)
+        hooks = self.coordinator.get("hooks")
+
+        # Extract parent context based on context inheritance policy (caller-controlled)
+        # Messages are sanitized and formatted in one pass over the history;
+        # the default "none" mode skips the call (and its coroutine) entirely.
+        # Batch delegations share the same context text.
+        context_text = (
+            ""
+            if inherit_context == "none"
+            else await self._extract_parent_context(
+                inherit_context, inherit_context_turns
             )
+        )
 
-        # Note: Recursion depth limiting not yet implemented
-        # Future: Track depth in metadata and check against config.max_recursion_depth
+        if instructions is not None:
+            # BATCH MODE: One sub-session per instruction, run concurrently
+            return await self._execute_batch(
+                spawn_fn,
+                agent_name,
+                instructions,
+                context_text,
+                agents,
+                parent_session_id,
+                hooks,
+                provider_preferences,
+            )
 
-        # Get parent session ID from coordinator infrastructure
-        parent_session_id = self.coordinator.session_id
+        return await self._spawn_sub_session(
+            spawn_fn,
+            agent_name,
+            instruction,
+            context_text,
+            agents,
+            parent_session_id,
+            hooks,
+            provider_preferences,
+        )
 
+    async def _execute_batch(
+        self,
+        spawn_fn: Callable[..., Awaitable[dict[str, Any]]],
+        agent_name: str,
+        instructions: list[str],
+        context_text: str,
+        agents: dict[str, Any],
+        parent_session_id: str,
+        hooks: Any,
+        provider_preferences: list[ProviderPreference] | None,
+    ) -> ToolResult:
+        """Delegate several instructions to one agent concurrently (helper for execute).
+
+        Each instruction gets its own sub-session. At most
+        max_concurrent_delegates sub-sessions run at once; a failed delegation
+        is reported in its result entry without cancelling the others.
+
+        Args:
+            spawn_fn: The session.spawn capability
+            agent_name: Agent to delegate to
+            instructions: Task instructions, one sub-session each
+            context_text: Formatted parent context to prepend ("" for none)
+            agents: Agents registry passed to the spawner
+            parent_session_id: ID of the delegating session
+            hooks: Hook coordinator for event emission
+            provider_preferences: Ordered provider/model preferences, if any
+
+        Returns:
+            ToolResult whose output lists per-instruction results with
+            succeeded/failed counts; fails only if every delegation failed
+        """
+        semaphore = asyncio.Semaphore(
+            max(1, min(len(instructions), self.max_concurrent_delegates))
+        )
+
+        async def run_one(item: str) -> ToolResult:
+            async with semaphore:
+                return await self._spawn_sub_session(
+                    spawn_fn,
+                    agent_name,
+                    item,
+                    context_text,
+                    agents,
+                    parent_session_id,
+                    hooks,
+                    provider_preferences,
+                )
+
+        results = await asyncio.gather(*(run_one(item) for item in instructions))
+
+        entries = []
+        failed = 0
+        for item, result in zip(instructions, results):
+            if result.success:
+                entries.append({"instruction": item, **result.output})
+            else:
+                failed += 1
+                entries.append({"instruction": item, "error": result.error["message"]})
+
+        output = {
+            "results": entries,
+            "succeeded": len(results) - failed,
+            "failed": failed,
+        }
+        if failed == len(results):
+            return ToolResult(
+                success=False,
+                output=output,
+                error={"message": f"All {failed} delegations failed"},
+            )
+        return ToolResult(success=True, output=output)
+
+    async def _spawn_sub_session(
+        self,
+        spawn_fn: Callable[..., Awaitable[dict[str, Any]]],
+        agent_name: str,
+        instruction: str,
+        context_text: str,
+        agents: dict[str, Any],
+        parent_session_id: str,
+        hooks: Any,
+        provider_preferences: list[ProviderPreference] | None,
+    ) -> ToolResult:
+        """Spawn one sub-session for a validated delegation (helper for execute).
+
+        Args:
+            spawn_fn: The session.spawn capability
+            agent_name: Agent to delegate to
+            instruction: Task instruction for the agent
+            context_text: Formatted parent context to prepend ("" for none)
+            agents: Agents registry passed to the spawner
+            parent_session_id: ID of the delegating session
+            hooks: Hook coordinator for event emission
+            provider_preferences: Ordered provider/model preferences, if any
+
+        Returns:
+            ToolResult with success status and output or error
+        """
         # Generate hierarchical sub-session ID using W3C Trace Context format
         # Format: {parent-span}-{child-span}_{agent-name}
         # Underscore separator enables streaming UI to parse agent name
-        child_span = uuid.uuid4().hex[:16]  # 16-char child span ID
+        child_span = secrets.token_hex(8)  # 16-char child span ID
         sub_session_id = f"{parent_session_id}-{child_span}_{agent_name}"
 
-        # Get hooks for error handling (orchestrator will emit tool:pre/post)
-        hooks = self.coordinator.get("hooks")
-
         try:
-            # Get spawn capability (registered by app layer)
-            spawn_fn = self.coordinator.get_capability("session.spawn")
-            if spawn_fn is None:
-                return ToolResult(
-                    success=False,
-                    error={
-                        "message": "Session spawning not available. App layer must register 'session.spawn' capability."
-                    },
-                )
-
             # Get parent session from coordinator infrastructure
             parent_session = self.coordinator.session
 
             # Emit task:agent_spawned event
-            if hooks:
-                await hooks.emit(
-                    "task:agent_spawned",
-                    {
-                        "agent": agent_name,
-                        "sub_session_id": sub_session_id,
-                        "parent_session_id": parent_session_id,
-                    },
-                )
-
-            # Build tool inheritance policy from config
-            tool_inheritance = {}
-            if self.exclude_tools:
-                tool_inheritance["exclude_tools"] = self.exclude_tools
-            elif self.inherit_tools is not None:
-                tool_inheritance["inherit_tools"] = self.inherit_tools
-
-            # Build hook inheritance policy from config
-            hook_inheritance = {}
-            if self.exclude_hooks:
-                hook_inheritance["exclude_hooks"] = self.exclude_hooks
-            elif self.inherit_hooks is not None:
-                hook_inheritance["inherit_hooks"] = self.inherit_hooks
-
-            # Extract parent messages based on context inheritance policy (caller-controlled)
-            parent_messages = await self._extract_parent_messages(
-                inherit_context, inherit_context_turns
+            await self._emit(
+                hooks,
+                "task:agent_spawned",
+                {
+                    "agent": agent_name,
+                    "sub_session_id": sub_session_id,
+                    "parent_session_id": parent_session_id,
+                },
             )
 
-            # Format parent context into instruction if messages were extracted
+            # Format parent context into instruction if any was extracted
             # This ensures the child agent sees the parent context regardless of
             # how the session/orchestrator handles pre-existing context messages
             effective_instruction = instruction
-            if parent_messages:
-                logger.debug(
-                    f"Extracted {len(parent_messages)} parent messages for child session"
-                )
-                context_text = self._format_parent_context_for_instruction(
-                    parent_messages
-                )
+            if context_text:
+                logger.debug("Inheriting parent conversation context for child session")
                 effective_instruction = f"{context_text}\n\n[YOUR TASK]\n{instruction}"
 
             # Extract orchestrator config from parent session for inheritance
@@ -663,23 +970,23 @@ assistant: "I'm going to use the task tool to launch the greeting-responder agen
                 parent_session=parent_session,
                 agent_configs=agents,
                 sub_session_id=sub_session_id,
-                tool_inheritance=tool_inheritance,
-                hook_inheritance=hook_inheritance,
+                tool_inheritance=self._tool_inheritance,
+                hook_inheritance=self._hook_inheritance,
                 orchestrator_config=orchestrator_config,
                 provider_preferences=provider_preferences,
             )
 
             # Emit task:agent_completed event
-            if hooks:
-                await hooks.emit(
-                    "task:agent_completed",
-                    {
-                        "agent": agent_name,
-                        "sub_session_id": sub_session_id,
-                        "parent_session_id": parent_session_id,
-                        "success": True,
-                    },
-                )
+            await self._emit(
+                hooks,
+                "task:agent_completed",
+                {
+                    "agent": agent_name,
+                    "sub_session_id": sub_session_id,
+                    "parent_session_id": parent_session_id,
+                    "success": True,
+                },
+            )
 
             # Return output with session_id for multi-turn capability
             return ToolResult(
@@ -691,23 +998,78 @@ assistant: "I'm going to use the task tool to launch the greeting-responder agen
             )
 
         except Exception as e:
-            # Emit tool:error event
-            if hooks:
-                await hooks.emit(
-                    "tool:error",
-                    {
-                        "tool": "task",
-                        "agent": agent_name,
-                        "sub_session_id": sub_session_id,
-                        "parent_session_id": parent_session_id,
-                        "error": str(e),
-                    },
-                )
+            error_text = str(e)
+            # Emit tool:error event in the background; the caller gets the
+            # error without waiting for telemetry handlers
+            await self._emit(
+                hooks,
+                "tool:error",
+                {
+                    "tool": "task",
+                    "agent": agent_name,
+                    "sub_session_id": sub_session_id,
+                    "parent_session_id": parent_session_id,
+                    "error": error_text,
+                },
+                background=True,
+            )
 
             return ToolResult(
-                success=False, error={"message": f"Delegation failed: {str(e)}"}
+                success=False, error={"message": f"Delegation failed: {error_text}"}
             )
 
+    async def _emit(
+        self,
+        hooks: Any,
+        event: str,
+        data: dict[str, Any],
+        background: bool = False,
+    ) -> None:
+        """Emit a task lifecycle or error event if hooks are available.
+
+        Events are emitted as they happen rather than batched: consumers such
+        as the streaming UI rely on task:agent_spawned arriving before the
+        sub-session runs, not together with task:agent_completed.
+
+        Args:
+            hooks: Hook coordinator (may be None)
+            event: Event name
+            data: Event payload
+            background: Schedule the emit as a task instead of awaiting it,
+                for events with no ordering requirement (tool:error)
+        """
+        if not self._should_emit(hooks, event):
+            return
+
+        if background:
+            task = asyncio.create_task(hooks.emit(event, data))
+            _background_emits.add(task)
+            task.add_done_callback(_background_emit_done)
+        else:
+            await hooks.emit(event, data)
+
+    def _should_emit(self, hooks: Any, event: str) -> bool:
+        """Check whether an event has any registered handlers.
+
+        Handlers can be registered and unregistered at any time, so the
+        registry is asked on every emit. Hook coordinators that cannot list
+        handlers always receive events.
+
+        Args:
+            hooks: Hook coordinator (may be None)
+            event: Event name
+
+        Returns:
+            True if the event should be emitted
+        """
+        if not hooks:
+            return False
+
+        list_handlers = getattr(hooks, "list_handlers", None)
+        if list_handlers is None:
+            return True
+        return bool(list_handlers(event).get(event))
+
     async def _resume_existing_session(
         self, session_id: str, instruction: str, hooks
     ) -> ToolResult:
@@ -724,16 +1086,6 @@ assistant: "I'm going to use the task tool to launch the greeting-responder agen
         parent_session_id = self.coordinator.session_id
 
         try:
-            # Emit task:agent_resumed event
-            if hooks:
-                await hooks.emit(
-                    "task:agent_resumed",
-                    {
-                        "session_id": session_id,
-                        "parent_session_id": parent_session_id,
-                    },
-                )
-
             # Get resume capability (registered by app layer)
             resume_fn = self.coordinator.get_capability("session.resume")
             if resume_fn is None:
@@ -744,6 +1096,16 @@ assistant: "I'm going to use the task tool to launch the greeting-responder agen
                     },
                 )
 
+            # Emit task:agent_resumed event
+            await self._emit(
+                hooks,
+                "task:agent_resumed",
+                {
+                    "session_id": session_id,
+                    "parent_session_id": parent_session_id,
+                },
+            )
+
             # Resume sub-session
             result = await resume_fn(
                 sub_session_id=session_id,
@@ -751,15 +1113,15 @@ assistant: "I'm going to use the task tool to launch the greeting-responder agen
             )
 
             # Emit task:agent_completed event
-            if hooks:
-                await hooks.emit(
-                    "task:agent_completed",
-                    {
-                        "sub_session_id": session_id,
-                        "parent_session_id": parent_session_id,
-                        "success": True,
-                    },
-                )
+            await self._emit(
+                hooks,
+                "task:agent_completed",
+                {
+                    "sub_session_id": session_id,
+                    "parent_session_id": parent_session_id,
+                    "success": True,
+                },
+            )
 
             # Return output with session_id (same across turns)
             return ToolResult(
@@ -772,16 +1134,17 @@ assistant: "I'm going to use the task tool to launch the greeting-responder agen
 
         except FileNotFoundError as e:
             # Session not found
-            if hooks:
-                await hooks.emit(
-                    "tool:error",
-                    {
-                        "tool": "task",
-                        "session_id": session_id,
-                        "parent_session_id": parent_session_id,
-                        "error": f"Session not found: {str(e)}",
-                    },
-                )
+            await self._emit(
+                hooks,
+                "tool:error",
+                {
+                    "tool": "task",
+                    "session_id": session_id,
+                    "parent_session_id": parent_session_id,
+                    "error": f"Session not found: {str(e)}",
+                },
+                background=True,
+            )
             return ToolResult(
                 success=False,
                 error={
@@ -791,16 +1154,18 @@ assistant: "I'm going to use the task tool to launch the greeting-responder agen
 
         except Exception as e:
             # Other errors (corrupted metadata, etc.)
-            if hooks:
-                await hooks.emit(
-                    "tool:error",
-                    {
-                        "tool": "task",
-                        "session_id": session_id,
-                        "parent_session_id": parent_session_id,
-                        "error": str(e),
-                    },
-                )
+            error_text = str(e)
+            await self._emit(
+                hooks,
+                "tool:error",
+                {
+                    "tool": "task",
+                    "session_id": session_id,
+                    "parent_session_id": parent_session_id,
+                    "error": error_text,
+                },
+                background=True,
+            )
             return ToolResult(
-                success=False, error={"message": f"Resume failed: {str(e)}"}
+                success=False, error={"message": f"Resume failed: {error_text}"}
             )
@@ -0,0 +1,241 @@
+"""Module-specific tests for the task tool's delegation behavior."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from amplifier_core import HookRegistry
+from amplifier_core import HookResult
+from amplifier_core.testing import EventRecorder
+
+from amplifier_module_tool_task import TaskTool
+
+
+class FakeCoordinator:
+    """Coordinator exposing just what TaskTool reads."""
+
+    def __init__(
+        self,
+        session_id: str | None = "root-session",
+        capabilities: dict[str, Any] | None = None,
+        hooks: Any = None,
+    ):
+        self.session_id = session_id
+        self.session = SimpleNamespace(config={})
+        self.config = {"agents": {"worker": {"description": "Does work"}}}
+        self.capabilities = capabilities or {}
+        self.hooks = hooks
+
+    def get(self, mount_point: str) -> Any:
+        return self.hooks if mount_point == "hooks" else None
+
+    def get_capability(self, name: str) -> Any:
+        return self.capabilities.get(name)
+
+
+def make_spawn(fail_on: tuple[str, ...] = ()):
+    """Build a session.spawn capability that records its calls."""
+    calls: list[dict[str, Any]] = []
+
+    async def spawn(**kwargs: Any) -> dict[str, Any]:
+        calls.append(kwargs)
+        if kwargs["instruction"] in fail_on:
+            raise RuntimeError(f"cannot do {kwargs['instruction']}")
+        return {
+            "output": f"done: {kwargs['instruction']}",
+            "session_id": kwargs["sub_session_id"],
+        }
+
+    spawn.calls = calls
+    return spawn
+
+
+def make_tool(
+    session_id: str | None = "root-session",
+    config: dict[str, Any] | None = None,
+    fail_on: tuple[str, ...] = (),
+    hooks: Any = None,
+):
+    """Build a TaskTool with a recording spawn capability and hooks."""
+    spawn = make_spawn(fail_on)
+    if hooks is None:
+        hooks = EventRecorder()
+    coordinator = FakeCoordinator(
+        session_id=session_id,
+        capabilities={"session.spawn": spawn},
+        hooks=hooks,
+    )
+    return TaskTool(coordinator, config or {}), spawn, hooks
+
+
+async def child_session_id() -> str:
+    """Get a real first-level sub-session ID by delegating from a root session."""
+    tool, spawn, _ = make_tool()
+    result = await tool.execute({"agent": "worker", "instruction": "start"})
+    assert result.success
+    return spawn.calls[0]["sub_session_id"]
+
+
+class TestRecursionDepth:
+    """Delegation depth is derived from the sub-session ID format."""
+
+    @pytest.mark.asyncio
+    async def test_root_session_can_delegate(self):
+        tool, spawn, _ = make_tool()
+
+        result = await tool.execute({"agent": "worker", "instruction": "go"})
+
+        assert result.success
+        assert len(spawn.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_session_id_counts_as_root(self):
+        tool, spawn, _ = make_tool(session_id=None)
+
+        result = await tool.execute({"agent": "worker", "instruction": "go"})
+
+        assert result.success
+        assert len(spawn.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_child_session_rejected_by_default(self):
+        tool, spawn, hooks = make_tool(session_id=await child_session_id())
+
+        result = await tool.execute({"agent": "worker", "instruction": "go"})
+
+        assert not result.success
+        assert "Max recursion depth (1) exceeded" in result.error["message"]
+        assert spawn.calls == []
+        assert hooks.events == []
+
+    @pytest.mark.asyncio
+    async def test_child_session_allowed_with_higher_limit(self):
+        tool, spawn, _ = make_tool(
+            session_id=await child_session_id(), config={"max_recursion_depth": 2}
+        )
+
+        result = await tool.execute({"agent": "worker", "instruction": "go"})
+
+        assert result.success
+        assert len(spawn.calls) == 1
+
+
+class TestEventEmission:
+    """Lifecycle events reach handlers registered at any time."""
+
+    @pytest.mark.asyncio
+    async def test_handler_registered_after_delegation_receives_events(self):
+        registry = HookRegistry()
+        tool, _, _ = make_tool(hooks=registry)
+        await tool.execute({"agent": "worker", "instruction": "first"})
+
+        received = []
+
+        async def on_spawned(event: str, data: dict) -> HookResult:
+            received.append(data)
+            return HookResult(action="continue")
+
+        unregister = registry.register(
+            "task:agent_spawned", on_spawned, name="late-handler"
+        )
+        await tool.execute({"agent": "worker", "instruction": "second"})
+        unregister()
+        await tool.execute({"agent": "worker", "instruction": "third"})
+
+        assert len(received) == 1
+        assert received[0]["agent"] == "worker"
+
+
+class TestBatchDelegation:
+    """The instructions parameter fans out to one sub-session per entry."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("extra_input", "message"),
+        [
+            (
+                {"instruction": "solo", "instructions": ["a"]},
+                "either 'instruction' or 'instructions'",
+            ),
+            (
+                {"instructions": ["a"], "session_id": "sub-1"},
+                "cannot be used with session_id",
+            ),
+            ({"instructions": []}, "must be a non-empty list"),
+            ({"instructions": "a"}, "must be a non-empty list"),
+            ({"instructions": ["a", 1]}, "cannot contain empty entries"),
+            ({"instructions": ["a", "  "]}, "cannot contain empty entries"),
+            ({"instructions": ["a"] * 11}, "Too many instructions (11)"),
+        ],
+    )
+    async def test_invalid_batch_rejected(self, extra_input, message):
+        tool, spawn, hooks = make_tool()
+
+        result = await tool.execute({"agent": "worker", **extra_input})
+
+        assert not result.success
+        assert message in result.error["message"]
+        assert spawn.calls == []
+        assert hooks.events == []
+
+    @pytest.mark.asyncio
+    async def test_max_batch_size_configurable(self):
+        tool, spawn, _ = make_tool(config={"max_batch_size": 2})
+
+        rejected = await tool.execute({"agent": "worker", "instructions": ["a"] * 3})
+        accepted = await tool.execute({"agent": "worker", "instructions": ["a"] * 2})
+
+        assert not rejected.success
+        assert accepted.success
+        assert len(spawn.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_partial_failure_reported_per_entry(self):
+        tool, spawn, _ = make_tool(fail_on=("b",))
+
+        result = await tool.execute(
+            {"agent": "worker", "instructions": ["a", " b ", "c"]}
+        )
+
+        assert result.success
+        assert result.output["succeeded"] == 2
+        assert result.output["failed"] == 1
+        entries = result.output["results"]
+        assert [entry["instruction"] for entry in entries] == ["a", "b", "c"]
+        assert entries[0]["response"] == "done: a"
+        assert entries[1]["error"] == "Delegation failed: cannot do b"
+        assert "response" not in entries[1]
+        assert len(spawn.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_all_failed_fails_call(self):
+        tool, _, _ = make_tool(fail_on=("a", "b"))
+
+        result = await tool.execute({"agent": "worker", "instructions": ["a", "b"]})
+
+        assert not result.success
+        assert result.error["message"] == "All 2 delegations failed"
+        assert result.output["succeeded"] == 0
+        assert result.output["failed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_results_follow_instruction_order(self):
+        tool, _, _ = make_tool()
+
+        async def spawn(**kwargs: Any) -> dict[str, Any]:
+            # Earlier instructions finish later
+            await asyncio.sleep(0.01 * (3 - int(kwargs["instruction"])))
+            return {"output": kwargs["instruction"], "session_id": "sub"}
+
+        tool.coordinator.capabilities["session.spawn"] = spawn
+
+        result = await tool.execute(
+            {"agent": "worker", "instructions": ["0", "1", "2"]}
+        )
+
+        assert [entry["response"] for entry in result.output["results"]] == [
+            "0",
+            "1",
+            "2",
+        ]